@@ -1,7 +1,42 @@
+import os
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import streamlit as st
 
+# Chart styling set once at import; per-chart ax.grid(...) calls would
+# redo tick relayout on every rerun for the same result.
+plt.rcParams.update({
+    "axes.grid": True,
+    "grid.linestyle": "--",
+    "grid.alpha": 0.7,
+})
+
+try:
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
+try:
+    import duckdb
+    _HAS_DUCKDB = True
+except ImportError:
+    _HAS_DUCKDB = False
+
 # -----------------------------
 # Page config
 # -----------------------------
@@ -15,17 +50,398 @@ st.title("AWS EC2 & S3 Exploratory Dashboard")
 # -----------------------------
 # Load data (with caching)
 # -----------------------------
+EC2_CSV = "aws_resources_compute.csv"
+S3_CSV = "aws_resources_S3.csv"
+EC2_PARQUET = "aws_resources_compute.parquet"
+S3_PARQUET = "aws_resources_S3.parquet"
+
+# Only the columns the dashboard actually touches.
+EC2_COLUMNS = ["ResourceId", "Region", "CostUSD", "CPUUtilization"]
+S3_COLUMNS = ["BucketName", "Region", "CostUSD", "TotalSizeGB"]
+
+
+def _ensure_parquet(csv_path, parquet_path):
+    """One-time CSV -> Parquet conversion so warm starts skip CSV parsing."""
+    if not os.path.exists(parquet_path):
+        pd.read_csv(csv_path).to_parquet(parquet_path)
+
+
 @st.cache_data
 def load_data():
-    ec2 = pd.read_csv("aws_resources_compute.csv")
-    s3 = pd.read_csv("aws_resources_S3.csv")
-    return ec2, s3
+    # Prefer Parquet via PyArrow: columnar, typed, and reads only the
+    # columns we need, so cold load skips CSV tokenization and dtype
+    # inference entirely. Strings land in Arrow-backed columns via
+    # types_mapper instead of Python objects.
+    if _HAS_PYARROW:
+        _ensure_parquet(EC2_CSV, EC2_PARQUET)
+        _ensure_parquet(S3_CSV, S3_PARQUET)
+        ec2 = pq.read_table(EC2_PARQUET, columns=EC2_COLUMNS).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+        s3 = pq.read_table(S3_PARQUET, columns=S3_COLUMNS).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+    else:
+        # float32 halves the bytes per value (and so doubles effective
+        # bandwidth for every later scan); category columns come out of
+        # the parser as codes directly.
+        ec2 = pd.read_csv(
+            EC2_CSV,
+            usecols=EC2_COLUMNS,
+            dtype={
+                "CostUSD": "float32",
+                "CPUUtilization": "float32",
+                "Region": "category",
+                "ResourceId": "category",
+            },
+        )
+        s3 = pd.read_csv(
+            S3_CSV,
+            usecols=S3_COLUMNS,
+            dtype={
+                "CostUSD": "float32",
+                "TotalSizeGB": "float32",
+                "Region": "category",
+                "BucketName": "category",
+            },
+        )
+
+    # Categorical casts: .isin() and groupby() over these columns operate
+    # on small integer codes instead of hashing a string per row, and each
+    # repeated string is stored exactly once.
+    for col in ("Region", "ResourceId"):
+        ec2[col] = ec2[col].astype("category")
+    for col in ("Region", "BucketName"):
+        s3[col] = s3[col].astype("category")
+
+    # Cleaning lives inside the cached load so these scans run once per
+    # session instead of on every rerun.
+    ec2 = ec2[~ec2[["CostUSD", "CPUUtilization"]].isna().any(axis=1)]
+    s3["CostUSD"] = s3["CostUSD"].fillna(0)
+
+    # Slider bounds computed once here; reruns reuse the cached scalars
+    # instead of four min/max column scans.
+    bounds = {
+        "cost": (float(ec2["CostUSD"].min()), float(ec2["CostUSD"].max())),
+        "cpu": (
+            float(ec2["CPUUtilization"].min()),
+            float(ec2["CPUUtilization"].max()),
+        ),
+    }
+
+    return ec2, s3, bounds
+
+ec2_df, s3_df, bounds = load_data()
+
+# -----------------------------
+# Cached filtering / aggregation
+# -----------------------------
+# Every widget change reruns the whole script, so the filter mask and the
+# groupby/nlargest calls below are wrapped in st.cache_data keyed on the
+# (canonicalized) filter tuple. Repeated interactions with the same filter
+# settings become cache lookups instead of full-table scans. The DataFrame
+# arguments are underscore-prefixed so Streamlit skips hashing them; the
+# filter parameters alone form the cache key, which is valid because
+# load_data() is itself cached and deterministic.
+
+@st.cache_resource
+def region_row_groups(_df, name):
+    """Positional row indices per region, computed once per loaded frame.
+
+    Selecting regions then reduces to concatenating precomputed index
+    arrays, so rows from unselected regions are never touched.
+    """
+    return {
+        region: np.asarray(idx)
+        for region, idx in _df.groupby("Region", observed=True).indices.items()
+    }
+
+
+@st.cache_data(max_entries=32)
+def filter_ec2(_ec2, regions, cost_range, cpu_range):
+    groups = region_row_groups(_ec2, "ec2")
+    idx = [groups[r] for r in regions if r in groups]
+    if not idx:
+        return _ec2.iloc[:0]
+    candidates = _ec2.take(np.concatenate(idx))
+    # Range checks on raw ndarrays, combined in place: one boolean array
+    # is allocated and reused across all four comparisons instead of the
+    # intermediates Series.between() and chained & would produce. The
+    # filter is memory-bound, so fewer passes is what matters.
+    cost = candidates["CostUSD"].to_numpy(copy=False)
+    cpu = candidates["CPUUtilization"].to_numpy(copy=False)
+    mask = cost >= cost_range[0]
+    mask &= cost <= cost_range[1]
+    mask &= cpu >= cpu_range[0]
+    mask &= cpu <= cpu_range[1]
+    return candidates.iloc[np.flatnonzero(mask)]
+
+
+@st.cache_data(max_entries=32)
+def filter_s3(_s3, regions):
+    groups = region_row_groups(_s3, "s3")
+    idx = [groups[r] for r in regions if r in groups]
+    if not idx:
+        return _s3.iloc[:0]
+    return _s3.take(np.concatenate(idx))
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _segment_reduce(vals, starts, ends, mean):
+        # Segments are independent, so regions reduce in parallel.
+        out = np.empty(len(starts), np.float64)
+        for g in prange(len(starts)):
+            acc = 0.0
+            for i in range(starts[g], ends[g]):
+                acc += vals[i]
+            out[g] = acc / (ends[g] - starts[g]) if mean else acc
+        return out
+
+
+def _group_reduce(df, value_col, how):
+    """Per-region sum/mean via a segmented reduction over sorted codes.
+
+    Region is low-cardinality, so a stable sort of the int codes plus one
+    segmented reduction replaces the hashing and groupby-object
+    construction pandas does per call. With Numba installed the segments
+    reduce in parallel; otherwise np.add.reduceat covers it.
+    """
+    codes = df["Region"].cat.codes.to_numpy()
+    values = df[value_col].to_numpy(copy=False)
+    if len(values) == 0:
+        return pd.Series(dtype="float64", name=value_col)
+    order = np.argsort(codes, kind="stable")
+    values_sorted = values[order]
+    uniq, starts = np.unique(codes[order], return_index=True)
+    ends = np.append(starts[1:], len(values_sorted))
+    if _HAS_NUMBA:
+        out = _segment_reduce(values_sorted, starts, ends, how == "mean")
+    else:
+        out = np.add.reduceat(values_sorted, starts)
+        if how == "mean":
+            out = out / (ends - starts)
+    index = df["Region"].cat.categories[uniq]
+    return pd.Series(out, index=index, name=value_col)
+
+
+@st.cache_data(max_entries=32)
+def agg_avg_cost_region(_ec2_filtered, regions, cost_range, cpu_range):
+    return _group_reduce(_ec2_filtered, "CostUSD", "mean").sort_values(
+        ascending=False
+    )
+
+
+@st.cache_data(max_entries=32)
+def agg_storage_by_region(_s3_filtered, regions):
+    return _group_reduce(_s3_filtered, "TotalSizeGB", "sum").sort_values(
+        ascending=False
+    )
+
+
+def _top_k(df, col, k=5):
+    """Largest k rows by col, ascending, via O(n) argpartition.
+
+    nlargest(k).sort_values() sorts the whole column; partitioning first
+    and sorting only the k survivors avoids that.
+    """
+    vals = df[col].to_numpy(copy=False)
+    if len(vals) <= k:
+        return df.sort_values(col, ascending=True)
+    idx = np.argpartition(vals, -k)[-k:]
+    idx = idx[np.argsort(vals[idx])]
+    return df.iloc[idx]
+
+
+@st.cache_data(max_entries=32)
+def top_ec2_by_cost(_ec2_filtered, regions, cost_range, cpu_range):
+    return _top_k(_ec2_filtered, "CostUSD")
+
+
+@st.cache_data(max_entries=32)
+def top_s3_by_size(_s3_filtered, regions):
+    return _top_k(_s3_filtered, "TotalSizeGB")
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _hist20(x, lo, hi):
+        # Single branchless-ish pass over the contiguous float array;
+        # compiled once (cache=True persists across processes).
+        counts = np.zeros(20, np.int64)
+        inv = 20.0 / (hi - lo)
+        for v in x:
+            i = int((v - lo) * inv)
+            if i == 20:
+                i = 19
+            if 0 <= i < 20:
+                counts[i] += 1
+        return counts
+
+
+@st.cache_data(max_entries=32)
+def cpu_histogram(_ec2_filtered, regions, cost_range, cpu_range):
+    """20-bin CPU-utilization histogram as a Series indexed by bin center."""
+    x = _ec2_filtered["CPUUtilization"].to_numpy(dtype="float64")
+    lo = float(x.min())
+    hi = float(x.max())
+    if hi == lo:
+        hi = lo + 1.0
+    if _HAS_NUMBA:
+        counts = _hist20(x, lo, hi)
+        edges = np.linspace(lo, hi, 21)
+    else:
+        counts, edges = np.histogram(x, bins=20, range=(lo, hi))
+    return pd.Series(counts, index=np.round((edges[:-1] + edges[1:]) / 2, 1))
+
+
+# Cap on points sent to a scatter chart; beyond this the browser-side
+# renderer dominates latency and the extra points are not visible anyway.
+MAX_SCATTER_POINTS = 5000
+
+
+def _lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling over x-sorted data.
+
+    Returns the positional indices of the n_out points that best preserve
+    the visual shape: first and last point always, plus the point per
+    bucket forming the largest triangle with the previously kept point
+    and the next bucket's average.
+    """
+    n = len(x)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < n_out - 1 else n
+        avg_x = x[hi:nhi].mean()
+        avg_y = y[hi:nhi].mean()
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs(
+            (x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+@st.cache_data(max_entries=32)
+def downsample_scatter(_df, x_col, y_col, key):
+    """Cap a scatter input at MAX_SCATTER_POINTS rows via LTTB."""
+    if len(_df) <= MAX_SCATTER_POINTS:
+        return _df
+    df = _df.sort_values(x_col)
+    x = df[x_col].to_numpy(dtype="float64")
+    y = df[y_col].to_numpy(dtype="float64")
+    return df.iloc[_lttb(x, y, MAX_SCATTER_POINTS)]
+
+
+@st.cache_resource
+def get_fig(name, figsize=None):
+    """One persistent Figure/Axes per chart slot, reused across reruns.
+
+    Callers clear the axes and replot, so the figure, Agg canvas, and
+    font caches are allocated once per session instead of per rerun.
+    """
+    return plt.subplots(figsize=figsize)
+
+
+RAW_PAGE_SIZE = 100
+
+
+def paginated_table(df, label):
+    """Render df one 100-row page at a time.
+
+    Only the visible page is serialized to the browser, and the fixed
+    height keeps Streamlit's row virtualization on, instead of shipping
+    the whole filtered table on every rerun.
+    """
+    n_pages = max(1, -(-len(df) // RAW_PAGE_SIZE))
+    if n_pages > 1:
+        page = st.number_input(
+            f"{label} page (of {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            key=f"{label}_page",
+        ) - 1
+    else:
+        page = 0
+    st.dataframe(
+        df.iloc[page * RAW_PAGE_SIZE:(page + 1) * RAW_PAGE_SIZE],
+        use_container_width=True,
+        height=400,
+    )
+
+
+# Strategy matrix built once at import; only the two "Pattern Observed"
+# cells depend on the current filters and are patched in per rerun.
+_STRAT_BASE = pd.DataFrame([
+    {
+        "Area": "EC2",
+        "Pattern Observed": "No EC2 data for current filters",
+        "Optimization Action": "Rightsize instances or move flexible workloads to cheaper regions.",
+        "Expected Impact": "Lower compute spend while keeping performance acceptable."
+    },
+    {
+        "Area": "EC2",
+        "Pattern Observed": "Under-utilized instances with low CPU but non-trivial cost.",
+        "Optimization Action": "Downsize instance types or schedule shutdown outside business hours.",
+        "Expected Impact": "Avoid paying for idle capacity."
+    },
+    {
+        "Area": "S3",
+        "Pattern Observed": "No S3 data for current filters",
+        "Optimization Action": "Use lifecycle rules to move cold data to STANDARD_IA/GLACIER and expire old objects.",
+        "Expected Impact": "Reduce monthly storage cost, especially for archival data."
+    },
+    {
+        "Area": "S3",
+        "Pattern Observed": "Potential growth from versioning and duplicate copies.",
+        "Optimization Action": "Review versioning; clean up non-current versions and unnecessary replicas.",
+        "Expected Impact": "Control long-term storage growth and cost."
+    },
+])
+
+
+@st.cache_resource
+def build_static_opt_figs():
+    """The fully static Optimization-section figures, drawn once per process."""
+    impact_scores = {
+        "Rightsizing EC2 / Region Move": 35,
+        "EC2 Scheduling Idle Instances": 20,
+        "S3 Lifecycle Tiering": 30,
+        "S3 Versioning Cleanup": 15
+    }
+    impact_df = pd.DataFrame(
+        list(impact_scores.items()),
+        columns=["Optimization Action", "Estimated % Cost Reduction Potential"]
+    )
+
+    fig_impact, ax1 = plt.subplots(figsize=(7, 4))
+    ax1.barh(
+        impact_df["Optimization Action"],
+        impact_df["Estimated % Cost Reduction Potential"]
+    )
+    ax1.set_xlabel("Estimated % Cost Reduction Potential")
+    ax1.set_ylabel("Optimization Action")
+    ax1.set_title("Estimated Cost Reduction by Optimization Action")
 
-ec2_df, s3_df = load_data()
+    focus_data = {"EC2": 2, "S3": 2}
+    fig_focus, ax2 = plt.subplots()
+    ax2.pie(
+        focus_data.values(),
+        labels=focus_data.keys(),
+        autopct="%1.0f%%",
+        startangle=140,
+    )
+    ax2.set_title("Optimization Focus Areas (EC2 vs S3)")
 
-# Basic cleaning
-ec2_df = ec2_df.dropna(subset=["CostUSD", "CPUUtilization"])
-s3_df = s3_df.fillna({"CostUSD": 0})
+    return fig_impact, fig_focus
 
 # -----------------------------
 # Sidebar filters
@@ -49,8 +465,7 @@ selected_s3_regions = st.sidebar.multiselect(
 )
 
 # EC2 cost filter
-ec2_min_cost = float(ec2_df["CostUSD"].min())
-ec2_max_cost = float(ec2_df["CostUSD"].max())
+ec2_min_cost, ec2_max_cost = bounds["cost"]
 ec2_cost_range = st.sidebar.slider(
     "EC2 Cost (USD/hr)",
     min_value=ec2_min_cost,
@@ -59,8 +474,7 @@ ec2_cost_range = st.sidebar.slider(
 )
 
 # EC2 CPU filter
-ec2_min_cpu = float(ec2_df["CPUUtilization"].min())
-ec2_max_cpu = float(ec2_df["CPUUtilization"].max())
+ec2_min_cpu, ec2_max_cpu = bounds["cpu"]
 ec2_cpu_range = st.sidebar.slider(
     "EC2 CPU Utilization (%)",
     min_value=ec2_min_cpu,
@@ -74,13 +488,250 @@ show_raw_data = st.sidebar.checkbox("Show raw tables", value=False)
 # -----------------------------
 # Apply filters
 # -----------------------------
-ec2_filtered = ec2_df[
-    (ec2_df["Region"].isin(selected_ec2_regions)) &
-    (ec2_df["CostUSD"].between(ec2_cost_range[0], ec2_cost_range[1])) &
-    (ec2_df["CPUUtilization"].between(ec2_cpu_range[0], ec2_cpu_range[1]))
-]
+# Canonicalize the multiselect lists to sorted tuples so the cache key is
+# hashable and order-independent.
+ec2_region_key = tuple(sorted(selected_ec2_regions))
+s3_region_key = tuple(sorted(selected_s3_regions))
+
+if _HAS_DUCKDB:
+    @st.cache_resource
+    def duckdb_connection():
+        """Process-wide DuckDB connection with views over the source files.
+
+        The views fold the NaN cleaning into the scan, so every query
+        below is predicate-pushdown straight into the Parquet (or CSV)
+        reader.
+        """
+        con = duckdb.connect()
+        ec2_src = EC2_PARQUET if os.path.exists(EC2_PARQUET) else EC2_CSV
+        s3_src = S3_PARQUET if os.path.exists(S3_PARQUET) else S3_CSV
+        con.execute(
+            f"CREATE VIEW ec2 AS "
+            f"SELECT ResourceId, Region, CostUSD, CPUUtilization "
+            f"FROM '{ec2_src}' "
+            f"WHERE CostUSD IS NOT NULL AND CPUUtilization IS NOT NULL"
+        )
+        con.execute(
+            f"CREATE VIEW s3 AS "
+            f"SELECT BucketName, Region, COALESCE(CostUSD, 0) AS CostUSD, "
+            f"TotalSizeGB FROM '{s3_src}'"
+        )
+        return con
 
-s3_filtered = s3_df[s3_df["Region"].isin(selected_s3_regions)]
+    _EC2_PRED = (
+        "list_contains(?, Region) "
+        "AND CostUSD BETWEEN ? AND ? AND CPUUtilization BETWEEN ? AND ?"
+    )
+    _S3_PRED = "list_contains(?, Region)"
+
+    @st.cache_data(max_entries=32)
+    def _duckdb_derived(ec2_region_key, ec2_cost_range, ec2_cpu_range,
+                        s3_region_key):
+        """Filter + aggregations + top-k as parameterized DuckDB queries.
+
+        Each logical pipeline (filter, group-by, top-k) is one vectorized
+        SQL query; only the tiny result tables come back to Python.
+        """
+        con = duckdb_connection()
+        ec2_params = [
+            list(ec2_region_key),
+            ec2_cost_range[0], ec2_cost_range[1],
+            ec2_cpu_range[0], ec2_cpu_range[1],
+        ]
+        s3_params = [list(s3_region_key)]
+
+        ec2_filtered = con.execute(
+            f"SELECT * FROM ec2 WHERE {_EC2_PRED}", ec2_params
+        ).df()
+        s3_filtered = con.execute(
+            f"SELECT * FROM s3 WHERE {_S3_PRED}", s3_params
+        ).df()
+        avg_cost = con.execute(
+            f"SELECT Region, avg(CostUSD) AS CostUSD FROM ec2 "
+            f"WHERE {_EC2_PRED} GROUP BY Region ORDER BY CostUSD DESC",
+            ec2_params,
+        ).df()
+        storage = con.execute(
+            f"SELECT Region, sum(TotalSizeGB) AS TotalSizeGB FROM s3 "
+            f"WHERE {_S3_PRED} GROUP BY Region ORDER BY TotalSizeGB DESC",
+            s3_params,
+        ).df()
+        top_ec2 = con.execute(
+            f"SELECT * FROM (SELECT * FROM ec2 WHERE {_EC2_PRED} "
+            f"ORDER BY CostUSD DESC LIMIT 5) ORDER BY CostUSD ASC",
+            ec2_params,
+        ).df()
+        top_s3 = con.execute(
+            f"SELECT * FROM (SELECT * FROM s3 WHERE {_S3_PRED} "
+            f"ORDER BY TotalSizeGB DESC LIMIT 5) ORDER BY TotalSizeGB ASC",
+            s3_params,
+        ).df()
+
+        derived = {
+            "avg_cost_region": avg_cost.set_index("Region")["CostUSD"],
+            "storage_by_region": storage.set_index("Region")["TotalSizeGB"],
+            "cpu_hist": (
+                cpu_histogram(
+                    ec2_filtered, ec2_region_key, ec2_cost_range,
+                    ec2_cpu_range,
+                )
+                if not ec2_filtered.empty else None
+            ),
+            "ec2_scatter": downsample_scatter(
+                ec2_filtered, "CPUUtilization", "CostUSD",
+                (ec2_region_key, ec2_cost_range, ec2_cpu_range),
+            ),
+            "s3_scatter": downsample_scatter(
+                s3_filtered, "TotalSizeGB", "CostUSD", s3_region_key
+            ),
+            "top_ec2": top_ec2,
+            "top_s3": top_s3,
+        }
+        derived["total_storage_region"] = derived["storage_by_region"]
+        return ec2_filtered, s3_filtered, derived
+
+
+if _HAS_POLARS:
+    def _scan(parquet_path, csv_path, columns):
+        lf = (
+            pl.scan_parquet(parquet_path)
+            if os.path.exists(parquet_path) else pl.scan_csv(csv_path)
+        )
+        return lf.select(columns)
+
+    @st.cache_data(max_entries=32)
+    def _polars_derived(ec2_region_key, ec2_cost_range, ec2_cpu_range,
+                        s3_region_key):
+        """Filter + aggregations + top-k as one batch of lazy queries.
+
+        Polars fuses the predicate into the file scan and runs the
+        collected queries multi-threaded, so the whole per-rerun pipeline
+        is a single pass over the Arrow columns.
+        """
+        ec2_lf = _scan(EC2_PARQUET, EC2_CSV, EC2_COLUMNS).drop_nulls(
+            ["CostUSD", "CPUUtilization"]
+        ).filter(
+            pl.col("Region").is_in(list(ec2_region_key))
+            & pl.col("CostUSD").is_between(*ec2_cost_range)
+            & pl.col("CPUUtilization").is_between(*ec2_cpu_range)
+        )
+        s3_lf = _scan(S3_PARQUET, S3_CSV, S3_COLUMNS).with_columns(
+            pl.col("CostUSD").fill_null(0)
+        ).filter(pl.col("Region").is_in(list(s3_region_key)))
+
+        ec2_f, s3_f, avg_cost, storage, top_ec2, top_s3 = pl.collect_all([
+            ec2_lf,
+            s3_lf,
+            ec2_lf.group_by("Region")
+            .agg(pl.col("CostUSD").mean())
+            .sort("CostUSD", descending=True),
+            s3_lf.group_by("Region")
+            .agg(pl.col("TotalSizeGB").sum())
+            .sort("TotalSizeGB", descending=True),
+            ec2_lf.top_k(5, by="CostUSD").sort("CostUSD"),
+            s3_lf.top_k(5, by="TotalSizeGB").sort("TotalSizeGB"),
+        ])
+
+        # Results are tiny; convert to the pandas shapes the sections
+        # already consume.
+        ec2_filtered = ec2_f.to_pandas()
+        s3_filtered = s3_f.to_pandas()
+        derived = {
+            "avg_cost_region": pd.Series(
+                avg_cost.get_column("CostUSD").to_numpy(),
+                index=avg_cost.get_column("Region").to_pandas(),
+                name="CostUSD",
+            ),
+            "storage_by_region": pd.Series(
+                storage.get_column("TotalSizeGB").to_numpy(),
+                index=storage.get_column("Region").to_pandas(),
+                name="TotalSizeGB",
+            ),
+            "cpu_hist": (
+                cpu_histogram(
+                    ec2_filtered, ec2_region_key, ec2_cost_range,
+                    ec2_cpu_range,
+                )
+                if not ec2_filtered.empty else None
+            ),
+            "ec2_scatter": downsample_scatter(
+                ec2_filtered, "CPUUtilization", "CostUSD",
+                (ec2_region_key, ec2_cost_range, ec2_cpu_range),
+            ),
+            "s3_scatter": downsample_scatter(
+                s3_filtered, "TotalSizeGB", "CostUSD", s3_region_key
+            ),
+            "top_ec2": top_ec2.to_pandas(),
+            "top_s3": top_s3.to_pandas(),
+        }
+        derived["total_storage_region"] = derived["storage_by_region"]
+        return ec2_filtered, s3_filtered, derived
+
+
+def compute_derived(ec2_df, s3_df, ec2_region_key, ec2_cost_range,
+                    ec2_cpu_range, s3_region_key):
+    """Filtered frames plus every plotted artifact for one filter vector.
+
+    Everything the sections plot is computed exactly once, here. Section
+    bodies only read from the returned dict, so the same aggregation is
+    never requested twice under different names. With DuckDB installed
+    the pipeline runs as parameterized SQL over the source files; with
+    Polars it runs as one fused lazy query batch; otherwise the
+    pandas/NumPy path below applies.
+    """
+    if _HAS_DUCKDB:
+        return _duckdb_derived(
+            ec2_region_key, ec2_cost_range, ec2_cpu_range, s3_region_key
+        )
+    if _HAS_POLARS:
+        return _polars_derived(
+            ec2_region_key, ec2_cost_range, ec2_cpu_range, s3_region_key
+        )
+    ec2_filtered = filter_ec2(
+        ec2_df, ec2_region_key, ec2_cost_range, ec2_cpu_range
+    )
+    s3_filtered = filter_s3(s3_df, s3_region_key)
+    derived = {
+        "avg_cost_region": agg_avg_cost_region(
+            ec2_filtered, ec2_region_key, ec2_cost_range, ec2_cpu_range
+        ),
+        "storage_by_region": agg_storage_by_region(s3_filtered, s3_region_key),
+        "cpu_hist": (
+            cpu_histogram(
+                ec2_filtered, ec2_region_key, ec2_cost_range, ec2_cpu_range
+            )
+            if not ec2_filtered.empty else None
+        ),
+        "ec2_scatter": downsample_scatter(
+            ec2_filtered, "CPUUtilization", "CostUSD",
+            (ec2_region_key, ec2_cost_range, ec2_cpu_range),
+        ),
+        "s3_scatter": downsample_scatter(
+            s3_filtered, "TotalSizeGB", "CostUSD", s3_region_key
+        ),
+        "top_ec2": top_ec2_by_cost(
+            ec2_filtered, ec2_region_key, ec2_cost_range, ec2_cpu_range
+        ),
+        "top_s3": top_s3_by_size(s3_filtered, s3_region_key),
+    }
+    # Alias, not a recompute: the S3 and Overview sections show the same
+    # per-region storage totals.
+    derived["total_storage_region"] = derived["storage_by_region"]
+    return ec2_filtered, s3_filtered, derived
+
+
+# Short-circuit on the whole widget vector: reruns triggered by anything
+# other than a filter change (section switch, raw-data toggle, page
+# change) reuse the previous results without even paying the
+# st.cache_data key-hashing cost.
+filter_key = (ec2_region_key, ec2_cost_range, ec2_cpu_range, s3_region_key)
+if st.session_state.get("filter_key") != filter_key:
+    st.session_state.filter_results = compute_derived(
+        ec2_df, s3_df, ec2_region_key, ec2_cost_range, ec2_cpu_range,
+        s3_region_key,
+    )
+    st.session_state.filter_key = filter_key
+ec2_filtered, s3_filtered, derived = st.session_state.filter_results
 
 # -----------------------------
 # High-level KPIs
@@ -99,23 +750,32 @@ col4.metric(
 )
 
 # -----------------------------
-# Tabs for dashboard sections
+# Dashboard sections
 # -----------------------------
-tab_overview, tab_ec2, tab_s3, tab_top, tab_opt, tab_data = st.tabs(
-    [
-        "Overview / Compute Visualizations",
-        "EC2 Analysis",
-        "S3 Analysis",
-        "Top Resources",
-        "Optimization Strategies",
-        "Raw Data",
-    ]
+# st.tabs renders every tab's children on every rerun even though only
+# one is visible. A radio-driven selector keeps the same sections but
+# lets each rerun execute (and render) only the active one.
+SECTIONS = [
+    "Overview / Compute Visualizations",
+    "EC2 Analysis",
+    "S3 Analysis",
+    "Top Resources",
+    "Optimization Strategies",
+    "Raw Data",
+]
+
+active_section = st.radio(
+    "Section",
+    SECTIONS,
+    key="active_tab",
+    horizontal=True,
+    label_visibility="collapsed",
 )
 
 # =============================
-# Overview / Compute Tab
+# Overview / Compute Section
 # =============================
-with tab_overview:
+if active_section == "Overview / Compute Visualizations":
     st.subheader("Compute Visualizations")
 
     col_left, col_right = st.columns(2)
@@ -123,49 +783,29 @@ with tab_overview:
     # Left: Average EC2 Cost per Region (Filtered)
     with col_left:
         st.markdown("**Average EC2 Cost per Region (Filtered)**")
-        avg_cost_region = (
-            ec2_filtered
-            .groupby("Region")["CostUSD"]
-            .mean()
-            .sort_values(ascending=False)
-        )
+        avg_cost_region = derived["avg_cost_region"]
 
         if not avg_cost_region.empty:
-            fig, ax = plt.subplots()
-            avg_cost_region.plot(kind="bar", ax=ax)
-            ax.set_xlabel("AWS Region")
-            ax.set_ylabel("Avg Cost (USD/hr)")
-            ax.set_title("Average EC2 Cost per Region")
-            ax.grid(axis="y", linestyle="--", alpha=0.7)
-            st.pyplot(fig)
+            st.bar_chart(avg_cost_region, x_label="AWS Region",
+                         y_label="Avg Cost (USD/hr)")
         else:
             st.info("No EC2 data available for the selected filters.")
 
     # Right: S3 Total Storage by Region (Filtered)
     with col_right:
         st.markdown("**S3 Total Storage by Region (Filtered)**")
-        storage_by_region = (
-            s3_filtered
-            .groupby("Region")["TotalSizeGB"]
-            .sum()
-            .sort_values(ascending=False)
-        )
+        storage_by_region = derived["storage_by_region"]
 
         if not storage_by_region.empty:
-            fig, ax = plt.subplots()
-            storage_by_region.plot(kind="bar", ax=ax)
-            ax.set_xlabel("Region")
-            ax.set_ylabel("Total Size (GB)")
-            ax.set_title("S3 Total Storage by Region")
-            ax.grid(axis="y", linestyle="--", alpha=0.7)
-            st.pyplot(fig)
+            st.bar_chart(storage_by_region, x_label="Region",
+                         y_label="Total Size (GB)")
         else:
             st.info("No S3 data available for the selected filters.")
 
 # =============================
-# EC2 Analysis Tab
+# EC2 Analysis Section
 # =============================
-with tab_ec2:
+if active_section == "EC2 Analysis":
     st.subheader("EC2 Analysis")
 
     col1, col2 = st.columns(2)
@@ -174,12 +814,10 @@ with tab_ec2:
     with col1:
         st.markdown("**CPU Utilization Distribution**")
         if not ec2_filtered.empty:
-            fig, ax = plt.subplots()
-            ax.hist(ec2_filtered["CPUUtilization"], bins=20)
-            ax.set_xlabel("CPU Utilization (%)")
-            ax.set_ylabel("Frequency")
-            ax.set_title("EC2 CPU Utilization Distribution")
-            st.pyplot(fig)
+            # Pre-binned server-side so only 20 bar heights go to the
+            # browser instead of the raw column.
+            st.bar_chart(derived["cpu_hist"], x_label="CPU Utilization (%)",
+                         y_label="Frequency")
         else:
             st.info("No EC2 data available for the selected filters.")
 
@@ -187,20 +825,20 @@ with tab_ec2:
     with col2:
         st.markdown("**CPU vs Cost**")
         if not ec2_filtered.empty:
-            fig, ax = plt.subplots()
-            ax.scatter(ec2_filtered["CPUUtilization"], ec2_filtered["CostUSD"])
-            ax.set_xlabel("CPU Utilization (%)")
-            ax.set_ylabel("Cost (USD/hr)")
-            ax.set_title("EC2 CPU vs Cost")
-            ax.grid(True, linestyle="--", alpha=0.6)
-            st.pyplot(fig)
+            st.scatter_chart(
+                derived["ec2_scatter"],
+                x="CPUUtilization",
+                y="CostUSD",
+                x_label="CPU Utilization (%)",
+                y_label="Cost (USD/hr)",
+            )
         else:
             st.info("No EC2 data available for the selected filters.")
 
 # =============================
-# S3 Analysis Tab
+# S3 Analysis Section
 # =============================
-with tab_s3:
+if active_section == "S3 Analysis":
     st.subheader("S3 Analysis")
 
     col1, col2 = st.columns(2)
@@ -209,40 +847,30 @@ with tab_s3:
     with col1:
         st.markdown("**S3 Cost vs Storage Size**")
         if not s3_filtered.empty:
-            fig, ax = plt.subplots()
-            ax.scatter(s3_filtered["TotalSizeGB"], s3_filtered["CostUSD"])
-            ax.set_xlabel("Total Size (GB)")
-            ax.set_ylabel("Cost (USD)")
-            ax.set_title("S3 Cost vs Storage Size")
-            ax.grid(True, linestyle="--", alpha=0.6)
-            st.pyplot(fig)
+            st.scatter_chart(
+                derived["s3_scatter"],
+                x="TotalSizeGB",
+                y="CostUSD",
+                x_label="Total Size (GB)",
+                y_label="Cost (USD)",
+            )
         else:
             st.info("No S3 data available for the selected filters.")
 
     # S3: Total storage by region
     with col2:
         st.markdown("**Total S3 Storage per Region (Filtered)**")
-        total_storage_region = (
-            s3_filtered
-            .groupby("Region")["TotalSizeGB"]
-            .sum()
-            .sort_values(ascending=False)
-        )
+        total_storage_region = derived["total_storage_region"]
         if not total_storage_region.empty:
-            fig, ax = plt.subplots()
-            total_storage_region.plot(kind="bar", ax=ax)
-            ax.set_xlabel("AWS Region")
-            ax.set_ylabel("Total Storage (GB)")
-            ax.set_title("Total S3 Storage per Region")
-            ax.grid(axis="y", linestyle="--", alpha=0.7)
-            st.pyplot(fig)
+            st.bar_chart(total_storage_region, x_label="AWS Region",
+                         y_label="Total Storage (GB)")
         else:
             st.info("No S3 data available for the selected filters.")
 
 # =============================
-# Top Resources Tab
+# Top Resources Section
 # =============================
-with tab_top:
+if active_section == "Top Resources":
     st.subheader("Top Resources")
 
     col1, col2 = st.columns(2)
@@ -251,18 +879,15 @@ with tab_top:
     with col1:
         st.markdown("**Top 5 Most Expensive EC2 Instances (Filtered)**")
         if not ec2_filtered.empty:
-            top_ec2 = (
-                ec2_filtered
-                .nlargest(5, "CostUSD")
-                .sort_values("CostUSD", ascending=True)
-            )
+            top_ec2 = derived["top_ec2"]
 
-            fig, ax = plt.subplots()
+            fig, ax = get_fig("top_ec2")
+            ax.cla()
             ax.barh(top_ec2["ResourceId"], top_ec2["CostUSD"])
             ax.set_xlabel("Cost (USD/hr)")
             ax.set_ylabel("ResourceId")
             ax.set_title("Top 5 EC2 Instances by Cost")
-            st.pyplot(fig)
+            st.pyplot(fig, clear_figure=False)
 
             st.dataframe(
                 top_ec2[["ResourceId", "Region", "CostUSD"]],
@@ -275,18 +900,15 @@ with tab_top:
     with col2:
         st.markdown("**Top 5 Largest S3 Buckets (Filtered)**")
         if not s3_filtered.empty:
-            top_s3 = (
-                s3_filtered
-                .nlargest(5, "TotalSizeGB")
-                .sort_values("TotalSizeGB", ascending=True)
-            )
+            top_s3 = derived["top_s3"]
 
-            fig, ax = plt.subplots()
+            fig, ax = get_fig("top_s3")
+            ax.cla()
             ax.barh(top_s3["BucketName"], top_s3["TotalSizeGB"])
             ax.set_xlabel("Total Size (GB)")
             ax.set_ylabel("Bucket Name")
             ax.set_title("Top 5 S3 Buckets by Size")
-            st.pyplot(fig)
+            st.pyplot(fig, clear_figure=False)
 
             st.dataframe(
                 top_s3[["BucketName", "Region", "TotalSizeGB", "CostUSD"]],
@@ -296,79 +918,50 @@ with tab_top:
             st.info("No S3 data available for the selected filters.")
 
 # =============================
-# Optimization Strategies Tab
+# Optimization Strategies Section
 # =============================
-with tab_opt:
+if active_section == "Optimization Strategies":
     st.header("Optimization Strategies")
 
     # --- Dynamic insights from filtered data ---
 
     # EC2: region with highest average cost
     if not ec2_filtered.empty:
-        avg_cost_region_opt = (
-            ec2_filtered
-            .groupby("Region")["CostUSD"]
-            .mean()
-            .sort_values(ascending=False)
-        )
-        ec2_expensive_region = avg_cost_region_opt.idxmax()
-        ec2_expensive_value = avg_cost_region_opt.max()
+        avg_cost_region_opt = derived["avg_cost_region"]
+        # One argmax over the raw array instead of separate idxmax()
+        # and max() scans through Series indexing.
+        means = avg_cost_region_opt.to_numpy()
+        i = int(means.argmax())
+        ec2_expensive_region = avg_cost_region_opt.index[i]
+        ec2_expensive_value = float(means[i])
     else:
         ec2_expensive_region = None
         ec2_expensive_value = None
 
     # S3: region with highest total storage
     if not s3_filtered.empty:
-        storage_by_region_opt = (
-            s3_filtered
-            .groupby("Region")["TotalSizeGB"]
-            .sum()
-            .sort_values(ascending=False)
-        )
-        s3_heaviest_region = storage_by_region_opt.idxmax()
-        s3_heaviest_value = storage_by_region_opt.max()
+        storage_by_region_opt = derived["storage_by_region"]
+        totals = storage_by_region_opt.to_numpy()
+        i = int(totals.argmax())
+        s3_heaviest_region = storage_by_region_opt.index[i]
+        s3_heaviest_value = float(totals[i])
     else:
         s3_heaviest_region = None
         s3_heaviest_value = None
 
     # --- Build strategy matrix ---
-    strategies = []
-
-    strategies.append({
-        "Area": "EC2",
-        "Pattern Observed": (
-            f"Highest avg hourly cost in region {ec2_expensive_region} (~{ec2_expensive_value:.2f} USD/hr)"
-            if ec2_expensive_region else "No EC2 data for current filters"
-        ),
-        "Optimization Action": "Rightsize instances or move flexible workloads to cheaper regions.",
-        "Expected Impact": "Lower compute spend while keeping performance acceptable."
-    })
-
-    strategies.append({
-        "Area": "EC2",
-        "Pattern Observed": "Under-utilized instances with low CPU but non-trivial cost.",
-        "Optimization Action": "Downsize instance types or schedule shutdown outside business hours.",
-        "Expected Impact": "Avoid paying for idle capacity."
-    })
-
-    strategies.append({
-        "Area": "S3",
-        "Pattern Observed": (
-            f"Largest total storage in region {s3_heaviest_region} (~{s3_heaviest_value:,.0f} GB)"
-            if s3_heaviest_region else "No S3 data for current filters"
-        ),
-        "Optimization Action": "Use lifecycle rules to move cold data to STANDARD_IA/GLACIER and expire old objects.",
-        "Expected Impact": "Reduce monthly storage cost, especially for archival data."
-    })
-
-    strategies.append({
-        "Area": "S3",
-        "Pattern Observed": "Potential growth from versioning and duplicate copies.",
-        "Optimization Action": "Review versioning; clean up non-current versions and unnecessary replicas.",
-        "Expected Impact": "Control long-term storage growth and cost."
-    })
-
-    strategies_df = pd.DataFrame(strategies)
+    # Shallow copy of the 4-row base; only the two dynamic cells change.
+    strategies_df = _STRAT_BASE.copy()
+    if ec2_expensive_region:
+        strategies_df.iat[0, 1] = (
+            f"Highest avg hourly cost in region {ec2_expensive_region}"
+            f" (~{ec2_expensive_value:.2f} USD/hr)"
+        )
+    if s3_heaviest_region:
+        strategies_df.iat[2, 1] = (
+            f"Largest total storage in region {s3_heaviest_region}"
+            f" (~{s3_heaviest_value:,.0f} GB)"
+        )
 
     st.subheader("Optimization Strategy Matrix")
     st.dataframe(strategies_df, use_container_width=True)
@@ -378,40 +971,11 @@ with tab_opt:
     # ==========================================
     st.subheader("Optimization Visualizations")
 
-    # Bar chart: Estimated Impact by Action
-    impact_scores = {
-        "Rightsizing EC2 / Region Move": 35,
-        "EC2 Scheduling Idle Instances": 20,
-        "S3 Lifecycle Tiering": 30,
-        "S3 Versioning Cleanup": 15
-    }
-    impact_df = pd.DataFrame(
-        list(impact_scores.items()),
-        columns=["Optimization Action", "Estimated % Cost Reduction Potential"]
-    )
-
-    fig1, ax1 = plt.subplots(figsize=(7, 4))
-    ax1.barh(
-        impact_df["Optimization Action"],
-        impact_df["Estimated % Cost Reduction Potential"]
-    )
-    ax1.set_xlabel("Estimated % Cost Reduction Potential")
-    ax1.set_ylabel("Optimization Action")
-    ax1.set_title("Estimated Cost Reduction by Optimization Action")
-    ax1.grid(axis="x", linestyle="--", alpha=0.6)
-    st.pyplot(fig1)
-
-    # Pie chart: Focus distribution (EC2 vs S3)
-    focus_data = {"EC2": 2, "S3": 2}
-    fig2, ax2 = plt.subplots()
-    ax2.pie(
-        focus_data.values(),
-        labels=focus_data.keys(),
-        autopct="%1.0f%%",
-        startangle=140,
-    )
-    ax2.set_title("Optimization Focus Areas (EC2 vs S3)")
-    st.pyplot(fig2)
+    # Both figures are static, so they are drawn exactly once per process
+    # and only re-sent here.
+    fig_impact, fig_focus = build_static_opt_figs()
+    st.pyplot(fig_impact, clear_figure=False)
+    st.pyplot(fig_focus, clear_figure=False)
 
     st.markdown("""
 **Interpretation:**
@@ -421,16 +985,16 @@ with tab_opt:
 """)
 
 # =============================
-# Raw Data Tab
+# Raw Data Section
 # =============================
-with tab_data:
+if active_section == "Raw Data":
     st.subheader("Raw Data")
 
     if show_raw_data:
         st.markdown("### EC2 Data (Filtered)")
-        st.dataframe(ec2_filtered, use_container_width=True)
+        paginated_table(ec2_filtered, "EC2")
 
         st.markdown("### S3 Data (Filtered)")
-        st.dataframe(s3_filtered, use_container_width=True)
+        paginated_table(s3_filtered, "S3")
     else:
         st.info("Enable **'Show raw tables'** in the sidebar to view raw data.")
\ No newline at end of file